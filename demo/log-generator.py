@@ -7,15 +7,95 @@ Can simulate various incident scenarios to showcase the system's capabilities.
 """
 
 import json
+import os
 import random
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from json.encoder import encode_basestring_ascii
+from itertools import islice
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+# Prefer orjson for serialization when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# NumPy enables array-at-a-time sampling for bulk random generation
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Bulk runs at least this large are split across worker processes
+_PARALLEL_MIN_COUNT = 200_000
+
+# Records generated and written per chunk, bounding memory for large runs
+_CHUNK_SIZE = 65_536
+
+# Fixed JSONL layout used when records are emitted without building dicts
+_LINE_FMT = (
+    '{"timestamp":"%s","level":"%s","service":"%s","host":"%s","message":%s,'
+    '"incident_type":"%s","severity":"%s","source":"demo-log-generator"}\n'
+)
+
+
+def _dumps_line(log: Dict[str, Any]) -> bytes:
+    """Serialize a single log entry as a newline-terminated JSONL record"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(log, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(log) + '\n').encode('utf-8')
+
+
+def _dumps_lines(logs: List[Dict[str, Any]]) -> bytes:
+    """Serialize a list of log entries as JSONL bytes"""
+    if ORJSON_AVAILABLE and len(logs) > 64:
+        # Dump the whole list in one call and split records onto lines; safe
+        # because generated entries are flat and never contain '},{'
+        return orjson.dumps(logs)[1:-1].replace(b'},{', b'}\n{') + b'\n'
+    return b''.join([_dumps_line(log) for log in logs])
+
+
+def _write_file(filename: str, chunks: Iterable[bytes], preview: int = 3) -> List[Dict[str, Any]]:
+    """Stream JSONL chunks straight to a file descriptor, bypassing text IO
+
+    Returns the first `preview` entries written, decoded back into dicts.
+    """
+    samples = []
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(filename, flags, 0o644)
+    try:
+        for chunk in chunks:
+            if len(samples) < preview:
+                # Split off only the lines needed; chunks always end with a newline
+                samples.extend(
+                    json.loads(line) for line in chunk.split(b'\n', preview - len(samples))[:-1]
+                )
+            view = memoryview(chunk)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+    finally:
+        os.close(fd)
+    return samples
+
+
+def _generate_chunk(generator: 'DemoLogGenerator', count: int, seed: int) -> bytes:
+    """Worker entry point: generate one chunk of random logs as JSONL bytes"""
+    generator._rng.seed(seed)
+    return generator._bulk_generate(count)
+
 
 class DemoLogGenerator:
     """Generates realistic demo logs for infrastructure incidents"""
 
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        # Per-instance RNG; pass a seed for reproducible output
+        self._rng = random.Random(seed)
+
         # Template for different types of logs
         self.templates = {
             'database_connection_pool': {
@@ -115,39 +195,92 @@ class DemoLogGenerator:
             'cache-01', 'cache-02', 'worker-01', 'worker-02'
         ]
 
+        # Templates flattened into tuples indexed by small ints, so sampling
+        # resolves names once and then only does tuple indexing
+        self._incident_names = tuple(self.templates)
+        self._incident_index = {name: i for i, name in enumerate(self._incident_names)}
+        self._severity_names_by_incident = tuple(
+            tuple(self.templates[name]) for name in self._incident_names
+        )
+        self._severity_index = tuple(
+            {severity: j for j, severity in enumerate(severities)}
+            for severities in self._severity_names_by_incident
+        )
+
+        # Each template pre-rendered as a '%' format string taking the service
+        # (and host, unless the message already names a node or container)
+        self._messages = tuple(
+            tuple(
+                tuple(self._compile_template(msg) for msg in self.templates[name][severity])
+                for severity in severities
+            )
+            for name, severities in zip(self._incident_names, self._severity_names_by_incident)
+        )
+
+        # Severity indices per incident that actually have templates
+        self._nonempty_sev = tuple(
+            tuple(j for j, msgs in enumerate(by_severity) if msgs)
+            for by_severity in self._messages
+        )
+
+    @staticmethod
+    def _compile_template(message: str):
+        """Turn a raw template into a (format string, needs_host) pair"""
+        needs_host = 'node-' not in message and 'container' not in message
+        fmt = '[%s] ' + message.replace('%', '%%')
+        if needs_host:
+            fmt += ' on %s'
+        return fmt, needs_host
+
     def generate_single_log(self, incident_type: str = 'random',
-                           severity: str = 'random') -> Dict[str, Any]:
-        """Generate a single demo log entry"""
+                           severity: str = 'random',
+                           timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """Generate a single demo log entry
+
+        If no timestamp is given, a random time within the last hour is used.
+        """
+
+        rng = self._rng
+        randrange = rng.randrange
+        choice = rng.choice
 
         if incident_type == 'random':
-            incident_type = random.choice(list(self.templates.keys()))
+            incident_idx = randrange(len(self._incident_names))
+            incident_type = self._incident_names[incident_idx]
+        else:
+            incident_idx = self._incident_index[incident_type]
 
+        # Per-incident tables bound once for the rest of the call
+        severity_names = self._severity_names_by_incident[incident_idx]
+        messages_by_severity = self._messages[incident_idx]
         if severity == 'random':
-            severity = random.choice(list(self.templates[incident_type].keys()))
+            severity_idx = randrange(len(severity_names))
+            severity = severity_names[severity_idx]
+        else:
+            severity_idx = self._severity_index[incident_idx][severity]
 
-        templates = self.templates[incident_type][severity]
+        templates = messages_by_severity[severity_idx]
         if not templates:
             # Fallback to another severity if current has no templates
-            severity = random.choice(['high', 'medium', 'critical'])
-            templates = self.templates[incident_type][severity]
-
-        message = random.choice(templates)
-        host = random.choice(self.hosts)
-        service = random.choice(self.services)
+            severity_idx = choice(self._nonempty_sev[incident_idx])
+            severity = severity_names[severity_idx]
+            templates = messages_by_severity[severity_idx]
 
-        # Add service context to message if not present
-        if f'[{service}]' not in message:
-            message = f'[{service}] {message}'
+        fmt, needs_host = choice(templates)
+        host = choice(self.hosts)
+        service = choice(self.services)
 
-        # Add host context if relevant
-        if 'node-' not in message and 'container' not in message:
-            message = f'{message} on {host}'
+        # Add service context, and host context if relevant
+        message = fmt % ((service, host) if needs_host else (service,))
 
         # Generate timestamp within last hour
-        timestamp = datetime.now() - timedelta(minutes=random.randint(0, 60))
+        if timestamp is None:
+            timestamp = (
+                datetime.now() - timedelta(minutes=rng.randint(0, 60))
+            ).isoformat(timespec='microseconds')
 
         return {
-            'timestamp': timestamp.isoformat(),
+            'timestamp': timestamp,
             'level': severity.upper(),
             'service': service,
             'host': host,
@@ -157,8 +290,104 @@ class DemoLogGenerator:
             'source': 'demo-log-generator'
         }
 
+    def _bulk_pick(self, count: int):
+        """Draw parallel columns of random choices for `count` records"""
+        rng = self._rng
+        incident_idx = rng.choices(range(len(self._incident_names)), k=count)
+        severity_idx = [rng.choice(self._nonempty_sev[i]) for i in incident_idx]
+
+        incidents = [self._incident_names[i] for i in incident_idx]
+        severities = [
+            self._severity_names_by_incident[i][j] for i, j in zip(incident_idx, severity_idx)
+        ]
+        messages = [rng.choice(self._messages[i][j]) for i, j in zip(incident_idx, severity_idx)]
+        hosts = rng.choices(self.hosts, k=count)
+        services = rng.choices(self.services, k=count)
+
+        # Timestamps within the last hour; each distinct offset is formatted once.
+        # Offsets are whole seconds, so every record shares now's microseconds
+        now = time.time()
+        base = int(now)
+        micros = '.%06d' % int((now - base) * 1_000_000)
+        formatted = {}
+        timestamps = []
+        for offset in rng.choices(range(3601), k=count):
+            timestamp = formatted.get(offset)
+            if timestamp is None:
+                timestamp = formatted[offset] = time.strftime(
+                    '%Y-%m-%dT%H:%M:%S', time.localtime(base - offset)
+                ) + micros
+            timestamps.append(timestamp)
+
+        return incidents, severities, messages, hosts, services, timestamps
+
+    def _bulk_pick_numpy(self, count: int):
+        """Same columns as _bulk_pick, sampled array-at-a-time with NumPy"""
+        rng = np.random.default_rng(self._rng.getrandbits(64))
+
+        incident_types = self._incident_names
+        severities = self._nonempty_sev
+        sev_counts = np.array([len(sevs) for sevs in severities], np.int32)
+
+        # Message counts per (incident, severity), flattened as incident * max_sev + sev
+        max_sev = int(sev_counts.max())
+        msg_counts = np.zeros(len(incident_types) * max_sev, np.int32)
+        for i, sevs in enumerate(severities):
+            for s, j in enumerate(sevs):
+                msg_counts[i * max_sev + s] = len(self._messages[i][j])
+
+        # Draw all random indices up front, one array per column
+        incident_idx = rng.integers(0, len(incident_types), count)
+        severity_idx = (rng.random(count) * sev_counts[incident_idx]).astype(np.intp)
+        message_idx = (
+            rng.random(count) * msg_counts[incident_idx * max_sev + severity_idx]
+        ).astype(np.intp)
+        host_idx = rng.integers(0, len(self.hosts), count)
+        service_idx = rng.integers(0, len(self.services), count)
+        offsets = rng.integers(0, 3601, count)
+
+        # Timestamps within the last hour, formatted in one pass
+        now = np.datetime64(datetime.now(), 'us')
+        timestamps = (now - offsets.astype('timedelta64[s]')).astype(str)
+
+        incident_col = []
+        severity_col = []
+        message_col = []
+        for i, s, m in zip(incident_idx.tolist(), severity_idx.tolist(), message_idx.tolist()):
+            j = severities[i][s]
+            incident_col.append(incident_types[i])
+            severity_col.append(self._severity_names_by_incident[i][j])
+            message_col.append(self._messages[i][j][m])
+
+        hosts = [self.hosts[h] for h in host_idx.tolist()]
+        services = [self.services[v] for v in service_idx.tolist()]
+
+        return incident_col, severity_col, message_col, hosts, services, timestamps.tolist()
+
+    def _bulk_generate(self, count: int) -> bytes:
+        """Generate random logs as JSONL bytes without building per-record dicts"""
+        if NUMPY_AVAILABLE:
+            columns = self._bulk_pick_numpy(count)
+        else:
+            columns = self._bulk_pick(count)
+
+        lines = []
+        for incident_type, severity, (fmt, needs_host), host, service, timestamp in zip(*columns):
+            message = fmt % ((service, host) if needs_host else (service,))
+
+            lines.append(_LINE_FMT % (
+                timestamp, severity.upper(), service, host,
+                encode_basestring_ascii(message), incident_type, severity
+            ))
+
+        return ''.join(lines).encode('ascii')
+
     def generate_scenario_logs(self, scenario: str, count: int = 10) -> List[Dict[str, Any]]:
         """Generate a sequence of logs for a specific incident scenario"""
+        return list(self._iter_scenario_logs(scenario, count))
+
+    def _iter_scenario_logs(self, scenario: str, count: int) -> Iterator[Dict[str, Any]]:
+        """Lazily yield the logs of generate_scenario_logs"""
         scenarios = {
             'database_crash': ('database_connection_pool', 'critical'),
             'memory_leak': ('memory_exhaustion', 'high'),
@@ -170,27 +399,53 @@ class DemoLogGenerator:
 
         incident_type, severity = scenarios.get(scenario, ('database_connection_pool', 'critical'))
 
-        logs = []
         base_time = datetime.now() - timedelta(minutes=count)
 
         for i in range(count):
-            log = self.generate_single_log(incident_type, severity)
-            # Override timestamp to create a sequence
-            log['timestamp'] = (base_time + timedelta(minutes=i)).isoformat()
-            logs.append(log)
-
-        return logs
-
-    def generate_jsonl_file(self, filename: str, count: int = 20, scenario: str = 'random'):
-        """Generate a JSONL file with demo logs"""
-        if scenario == 'random':
-            logs = [self.generate_single_log() for _ in range(count)]
+            # Timestamps one minute apart to create a sequence
+            timestamp = (base_time + timedelta(minutes=i)).isoformat(timespec='microseconds')
+            yield self.generate_single_log(incident_type, severity, timestamp)
+
+    def _iter_chunks(self, count: int, scenario: str = 'random',
+                     workers: Optional[int] = None) -> Iterator[bytes]:
+        """Yield JSONL bytes in chunks of at most _CHUNK_SIZE records"""
+        sizes = [min(_CHUNK_SIZE, count - start) for start in range(0, count, _CHUNK_SIZE)]
+
+        if scenario != 'random':
+            logs = self._iter_scenario_logs(scenario, count)
+            for size in sizes:
+                yield _dumps_lines(list(islice(logs, size)))
+            return
+
+        # Derive one seed per chunk so output follows this generator's seed,
+        # whether the chunks are generated here or in worker processes
+        seeds = [self._rng.getrandbits(64) for _ in sizes]
+
+        workers = workers or os.cpu_count() or 1
+        if workers > 1 and count >= _PARALLEL_MIN_COUNT:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                yield from pool.map(_generate_chunk, [self] * len(sizes), sizes, seeds)
         else:
-            logs = self.generate_scenario_logs(scenario, count)
-
-        with open(filename, 'w') as f:
-            for log in logs:
-                f.write(json.dumps(log) + '\n')
+            # Chunks reseed the RNG; restore it so later calls match the parallel path
+            state = self._rng.getstate()
+            try:
+                for size, seed in zip(sizes, seeds):
+                    yield _generate_chunk(self, size, seed)
+            finally:
+                self._rng.setstate(state)
+
+    def write_jsonl(self, filename: str, count: int, scenario: str = 'random',
+                    workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Stream demo logs to a JSONL file and return the first few as samples"""
+        return _write_file(filename, self._iter_chunks(count, scenario, workers))
+
+    def generate_jsonl_file(self, filename: str, count: int = 20, scenario: str = 'random',
+                            workers: Optional[int] = None):
+        """Generate a JSONL file with demo logs
+
+        Large random runs are spread over `workers` processes (default: CPU count).
+        """
+        self.write_jsonl(filename, count, scenario, workers)
 
         print(f"Generated {count} demo logs in {filename}")
 
@@ -205,29 +460,21 @@ def main():
         'random', 'database_crash', 'memory_leak', 'disk_full',
         'auth_outage', 'network_issue', 'ssl_expiry'
     ], default='random', help='Specific incident scenario')
+    parser.add_argument('--seed', type=int, help='Random seed for reproducible output')
 
     args = parser.parse_args()
 
-    generator = DemoLogGenerator()
-
-    if args.scenario == 'random':
-        logs = [generator.generate_single_log() for _ in range(args.count)]
-    else:
-        logs = generator.generate_scenario_logs(args.scenario, args.count)
+    generator = DemoLogGenerator(seed=args.seed)
 
-    # Save to file
-    with open(args.output, 'w') as f:
-        for log in logs:
-            f.write(json.dumps(log) + '\n')
+    # Stream to file, keeping only a few entries to show
+    samples = generator.write_jsonl(args.output, args.count, args.scenario)
 
     print(f"Generated {args.count} demo logs in {args.output} for scenario: {args.scenario}")
 
     # Print sample logs
     print("\nSample logs:")
-    for log in logs[:3]:
+    for log in samples:
         print(f"[{log['timestamp']}] {log['level']}: {log['message']}")
 
 if __name__ == '__main__':
     main()
-</parameter>
-</write_to_file>
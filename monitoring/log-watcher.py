@@ -25,9 +25,12 @@ import os
 import re
 import sys
 import time
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
+from xml.etree import ElementTree
 from dataclasses import dataclass, asdict
 import subprocess
 import platform
@@ -52,6 +55,75 @@ try:
 except ImportError:
     DOCKER_AVAILABLE = False
 
+try:
+    import aiodocker
+    AIODOCKER_AVAILABLE = True
+except ImportError:
+    AIODOCKER_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+try:
+    import aiofile
+    AIOFILE_AVAILABLE = True
+except ImportError:
+    AIOFILE_AVAILABLE = False
+
+try:
+    import ahocorasick_rs
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+try:
+    import win32evtlog
+    WIN32EVTLOG_AVAILABLE = True
+except ImportError:
+    WIN32EVTLOG_AVAILABLE = False
+
+try:
+    from systemd import journal
+    SYSTEMD_AVAILABLE = True
+except ImportError:
+    SYSTEMD_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+try:
+    import logwatcher_rs
+    # Run from monitoring/, the unbuilt source directory imports as an empty
+    # namespace package
+    LOGWATCHER_RS_AVAILABLE = hasattr(logwatcher_rs, "Matcher")
+except ImportError:
+    LOGWATCHER_RS_AVAILABLE = False
+
 
 # Configuration from environment
 KESTRA_WEBHOOK_URL = os.getenv("KESTRA_WEBHOOK_URL", "http://localhost:8080/api/v1/webhooks/incident-webhook")
@@ -59,6 +131,30 @@ MCP_SERVER_URL = os.getenv("MCP_SERVER_URL", "http://localhost:3001")
 API_KEY = os.getenv("API_KEY", "")
 MONITOR_INTERVAL = int(os.getenv("MONITOR_INTERVAL", "5"))
 
+# The Rust matcher extension is opt-in until a build has been checked against
+# the re module on DEFAULT_PATTERNS
+USE_NATIVE_MATCHER = os.getenv("USE_NATIVE_MATCHER", "").lower() in ("1", "true", "yes")
+
+# Number of recently seen lines remembered for de-duplication
+SEEN_LINES_MAX = 10000
+
+# Appended log data is read in chunks of this many bytes
+READ_CHUNK_SIZE = 1 << 22
+
+# Incidents are queued and sent in the background in small batches
+INCIDENT_QUEUE_MAX = 1000
+INCIDENT_BATCH_SIZE = 50
+INCIDENT_BATCH_WINDOW = 0.25  # seconds
+
+# Maximum number of files a directory watcher scans concurrently
+DIRECTORY_CONCURRENCY = 16
+
+# File change notifications arriving within this window are coalesced
+WATCH_DEBOUNCE = 0.1  # seconds
+
+# Windows events delivered by subscription: critical, error and warning levels
+WINDOWS_EVENT_QUERY = "*[System[(Level=1 or Level=2 or Level=3)]]"
+
 
 @dataclass
 class LogPattern:
@@ -232,46 +328,660 @@ DEFAULT_PATTERNS: List[LogPattern] = [
 ]
 
 
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse as _sre_parse
+
+_REPEATS = tuple(
+    getattr(_sre_parse, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(_sre_parse, name)
+)
+
+
+def _split_alternatives(pattern: str) -> List[str]:
+    """Split a regex on its top-level '|' (outside groups and character classes)"""
+    parts, depth, in_class, start, i = [], 0, False, 0, 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            i += 1
+        elif in_class:
+            in_class = ch != "]"
+        elif ch == "[":
+            in_class = True
+            # A ']' right after '[' or '[^' is a member, not the end of the class
+            if pattern[i + 1:i + 2] == "^":
+                i += 1
+            if pattern[i + 1:i + 2] == "]":
+                i += 1
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "|" and depth == 0:
+            parts.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    parts.append(pattern[start:])
+    return parts
+
+
+def _expand_alternative(alternative: str) -> List[str]:
+    """Expand a leading group of plain alternatives, e.g. (ERROR|FATAL).*x
+
+    Returns ["ERROR.*x", "FATAL.*x"] for that example, or [alternative]
+    unchanged when it doesn't start with such a group.
+    """
+    if alternative.startswith("(") and not alternative.startswith("(?"):
+        end = alternative.find(")")
+        inner = alternative[1:end]
+        rest = alternative[end + 1:]
+        if end > 0 and rest[:1] not in ("?", "*", "+", "{") and re.fullmatch(r"[\w\-: |]+", inner):
+            expanded = []
+            for option in inner.split("|"):
+                expanded.extend(_expand_alternative(option + rest))
+            return expanded
+    return [alternative]
+
+
+def _required_literal(alternative: str, min_length: int = 3) -> Optional[str]:
+    """Longest lowercase literal that every match of the alternative must contain
+
+    Uses the stdlib regex parser, so quantifier bodies and character classes
+    are never mistaken for literal text:
+
+    >>> _required_literal("ab{2,10}c")
+    'abb'
+    >>> _required_literal("[]abc]xyz")
+    'xyz'
+    >>> _required_literal("ERROR.*timed? out")
+    'error'
+    """
+    try:
+        items = _sre_parse.parse(alternative)
+    except (re.error, OverflowError, RecursionError):
+        return None
+
+    runs, current = [], ""
+    for op, av in items:
+        if op is _sre_parse.LITERAL:
+            current += chr(av)
+            continue
+        # A repeated literal, e.g. b+ or b{2,5}, contributes its minimum count
+        if op in _REPEATS and av[0] >= 1 and len(av[2]) == 1 and av[2][0][0] is _sre_parse.LITERAL:
+            required = chr(av[2][0][1]) * av[0]
+            if av[0] == av[1]:
+                current += required
+            else:
+                runs.append(current + required)
+                current = required
+            continue
+        runs.append(current)
+        current = ""
+    runs.append(current)
+
+    longest = max(runs, key=len)
+    return longest.lower() if len(longest) >= min_length else None
+
+
+def _literal_chains(pattern: str) -> Optional[List[tuple]]:
+    """Reduce a pattern to ordered literal chains if it only uses literals and '.*'
+
+    e.g. "Out of memory|OOM.*killer" -> [("out of memory",), ("oom", "killer")].
+    Returns None if any alternative needs the regex engine.
+    """
+    chains = []
+    for alternative in _split_alternatives(pattern):
+        for expanded in _expand_alternative(alternative):
+            pieces = tuple(piece.lower() for piece in expanded.split(".*") if piece)
+            if not pieces or any(ch in "\\.^$*+?{}[]()|" for piece in pieces for ch in piece):
+                return None
+            chains.append(pieces)
+    return chains
+
+
+def _chain_in(chain: tuple, text: str) -> bool:
+    """True if the literals of a chain occur in order in text"""
+    pos = 0
+    for piece in chain:
+        pos = text.find(piece, pos)
+        if pos < 0:
+            return False
+        pos += len(piece)
+    return True
+
+
+def _walk_parsed(items):
+    """Yield every (op, av) node of a parsed regex, including nested ones"""
+    for op, av in items:
+        yield op, av
+        for child in av if isinstance(av, (tuple, list)) else ():
+            if isinstance(child, _sre_parse.SubPattern):
+                yield from _walk_parsed(child)
+            elif isinstance(child, list):
+                for sub in child:
+                    if isinstance(sub, _sre_parse.SubPattern):
+                        yield from _walk_parsed(sub)
+
+
+def _uses_unicode_classes(pattern: str) -> bool:
+    """True if the pattern uses \\w, \\s, \\d or \\b (or their negations)
+
+    Python matches these against Unicode, while RE2 treats them as ASCII-only,
+    so such patterns must stay on the stdlib path. Unparseable patterns count
+    as using them.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except (re.error, OverflowError, RecursionError):
+        return True
+    for op, av in _walk_parsed(parsed):
+        if op is _sre_parse.AT and av in (_sre_parse.AT_BOUNDARY, _sre_parse.AT_NON_BOUNDARY):
+            return True
+        if op is _sre_parse.IN and any(item_op is _sre_parse.CATEGORY for item_op, _ in av):
+            return True
+    return False
+
+
+def _lowercase_pattern(pattern: str) -> Optional[str]:
+    """Lowercase a pattern's literals, leaving escapes alone
+
+    Returns None when lowercasing could change its meaning (inline flags,
+    named groups, escapes that spell out characters, or class ranges with
+    an uppercase endpoint such as [A-z]).
+    """
+    if re.search(r"\(\?[^:]|\\[xuUN0-9]", pattern):
+        return None
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except (re.error, OverflowError, RecursionError):
+        return None
+    for op, av in _walk_parsed(parsed):
+        if op is _sre_parse.IN:
+            for item_op, item_av in av:
+                if item_op is _sre_parse.RANGE and any(
+                    chr(code) != chr(code).lower() for code in item_av
+                ):
+                    return None
+
+    out, i = [], 0
+    while i < len(pattern):
+        if pattern[i] == "\\":
+            out.append(pattern[i:i + 2])
+            i += 2
+        else:
+            out.append(pattern[i].lower())
+            i += 1
+    return "".join(out)
+
+
+if ORJSON_AVAILABLE:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+
+if XXHASH_AVAILABLE:
+    def _line_hash(line: str) -> int:
+        """64-bit xxh3 digest of a line, used for de-duplication"""
+        return xxhash.xxh3_64_intdigest(line.encode("utf-8", "surrogatepass"))
+else:
+    _line_hash = hash
+
+
+def _event_data_text(xml: str) -> str:
+    """Join the insertion strings of a rendered Windows event
+
+    Used when the publisher can't format the message; returns the XML itself
+    if it has no event data.
+
+    >>> _event_data_text(
+    ...     '<Event xmlns="http://schemas.microsoft.com/win/2004/08/events/event">'
+    ...     '<System><Provider Name="disk"/></System>'
+    ...     '<EventData><Data Name="reason">disk full</Data><Data>C:</Data></EventData>'
+    ...     '</Event>'
+    ... )
+    'disk full C:'
+    """
+    try:
+        root = ElementTree.fromstring(xml)
+    except ElementTree.ParseError:
+        return xml
+    texts = [
+        text.strip()
+        for section in root
+        if section.tag.rpartition("}")[2] in ("EventData", "UserData")
+        for text in section.itertext()
+        if text.strip()
+    ]
+    return " ".join(texts) or xml
+
+
+def _chain_source(chain: tuple) -> str:
+    """Python expression testing that a chain's literals occur in order in low"""
+    if len(chain) == 1:
+        return f"{chain[0]!r} in low"
+    # Checking the longest piece first rejects most lines cheaply
+    tests = [f"{max(chain, key=len)!r} in low", f"(_pos := low.find({chain[0]!r})) >= 0"]
+    for previous, piece in zip(chain, chain[1:-1]):
+        tests.append(f"(_pos := low.find({piece!r}, _pos + {len(previous)})) >= 0")
+    tests.append(f"low.find({chain[-1]!r}, _pos + {len(chain[-2])}) >= 0")
+    return " and ".join(tests)
+
+
+@lru_cache(maxsize=None)
+def _compile_cached(pattern: str) -> Tuple[re.Pattern, bool]:
+    """Compile a pattern once per process, shared by all watchers
+
+    Returns (regex, lowered). When lowered is True the regex was compiled
+    from a lowercased pattern without IGNORECASE and must search the
+    lowercased line, which spares SRE from folding case on every
+    comparison; otherwise it searches the original line.
+    """
+    lowered = _lowercase_pattern(pattern)
+    if lowered is not None:
+        try:
+            return re.compile(lowered), True
+        except re.error:
+            pass
+    return re.compile(pattern, re.IGNORECASE), False
+
+
+_DEFAULT_COMPILED = tuple((p, *_compile_cached(p.pattern)) for p in DEFAULT_PATTERNS)
+
+# Derived matchers keyed by pattern sources, shared by watchers using the same patterns
+_MATCHERS: Dict[tuple, tuple] = {}
+
+
 class LogWatcher:
     """Base class for log watching"""
 
     def __init__(self, patterns: List[LogPattern] = None):
         self.patterns = patterns or DEFAULT_PATTERNS
-        self.seen_lines: Set[str] = set()
-        self.compiled_patterns = [
-            (p, re.compile(p.pattern, re.IGNORECASE))
-            for p in self.patterns
-        ]
+        # HTTP session shared by all incident sends, created on first use
+        self._session: Optional["aiohttp.ClientSession"] = None
+        # Outgoing incidents, drained by a background flusher task
+        self._queue: "asyncio.Queue[Dict]" = asyncio.Queue(maxsize=INCIDENT_QUEUE_MAX)
+        self._flusher: Optional[asyncio.Task] = None
+        # Incidents carry time.time_ns(); the formatted second is cached for sends
+        self._ts_second: Optional[int] = None
+        self._ts_prefix = ""
+        # LRU of recent line hashes; evicts the oldest instead of clearing all
+        self.seen_lines: "OrderedDict[int, None]" = OrderedDict()
+        if self.patterns is DEFAULT_PATTERNS:
+            self.compiled_patterns = _DEFAULT_COMPILED
+        else:
+            self.compiled_patterns = [
+                (p, *_compile_cached(p.pattern))
+                for p in self.patterns
+            ]
+        key = tuple(p.pattern for p in self.patterns)
+        if key not in _MATCHERS:
+            _MATCHERS[key] = self._build_matchers()
+        (self.native_matcher, self.re2_set, self.re2_bytes, self.literal_patterns,
+         self.prefilter, self.specialized_matcher) = _MATCHERS[key]
+
+    def _build_matchers(self) -> tuple:
+        """Build the derived matching structures for self.patterns"""
+        # Rust RegexSet extension (monitoring/logwatcher_rs) matching with the GIL released
+        native_matcher = None
+        if USE_NATIVE_MATCHER and LOGWATCHER_RS_AVAILABLE:
+            try:
+                native_matcher = logwatcher_rs.Matcher([p.pattern for p in self.patterns])
+            except ValueError:
+                # Pattern syntax the regex crate doesn't support
+                pass
+        # Single-pass multi-pattern matcher when RE2 is available, plus a
+        # combined bytes regex for scanning appended file data in bulk
+        re2_set = self._build_re2_set() if RE2_AVAILABLE else None
+        re2_bytes = self._build_re2_bytes() if re2_set is not None else None
+        # Patterns that reduce to literal substrings skip the regex engine
+        literal_patterns: Dict[int, List[tuple]] = {}
+        for index, p in enumerate(self.patterns):
+            chains = _literal_chains(p.pattern)
+            if chains is not None:
+                literal_patterns[index] = chains
+        # An Aho-Corasick scan over required literals picks the candidate
+        # patterns, so lines without any of them skip the regex work entirely
+        prefilter = None
+        if native_matcher is None and AHOCORASICK_AVAILABLE:
+            prefilter = self._build_prefilter()
+        # Failing that, a function generated for this pattern set tests each
+        # pattern inline, without looping over the compiled list
+        specialized_matcher = None
+        if native_matcher is None and re2_set is None and prefilter is None:
+            specialized_matcher = self._build_specialized_matcher(literal_patterns)
+        return (native_matcher, re2_set, re2_bytes, literal_patterns,
+                prefilter, specialized_matcher)
+
+    def _build_re2_set(self):
+        """Compile all patterns into one RE2 set (None if any pattern is unsupported)
+
+        Patterns using \\w, \\s, \\d or \\b count as unsupported, since RE2
+        only matches them against ASCII.
+        """
+        if any(_uses_unicode_classes(p.pattern) for p in self.patterns):
+            return None
+        options = re2.Options()
+        options.case_sensitive = False
+        options.log_errors = False
+        pattern_set = re2.Set.SearchSet(options)
+        try:
+            # Set ids follow insertion order, so they index self.patterns
+            for p in self.patterns:
+                pattern_set.Add(p.pattern)
+            pattern_set.Compile()
+        except re2.error:
+            return None
+        return pattern_set
+
+    def _build_re2_bytes(self):
+        """Compile all patterns into one case-insensitive RE2 regex over bytes
+
+        The regex searches whole blocks of lines, so it runs in multiline
+        mode to keep ^ and $ anchored at line boundaries.
+        """
+        if any(_uses_unicode_classes(p.pattern) for p in self.patterns):
+            return None
+        options = re2.Options()
+        options.case_sensitive = False
+        options.log_errors = False
+        combined = b"(?m)" + b"|".join(b"(?:" + p.pattern.encode() + b")" for p in self.patterns)
+        try:
+            return re2.compile(combined, options)
+        except re2.error:
+            return None
+
+    def _build_prefilter(self):
+        """Build an Aho-Corasick automaton over each alternative's required literal
+
+        Returns (automaton, owning pattern index per literal, indices of
+        patterns without a usable literal), or None if no literal was found.
+        """
+        literals, owners, always = [], [], set()
+        for index, p in enumerate(self.patterns):
+            for alternative in _split_alternatives(p.pattern):
+                literal = _required_literal(alternative)
+                if literal is None:
+                    always.add(index)
+                else:
+                    literals.append(literal)
+                    owners.append(index)
+
+        if not literals:
+            return None
+        return ahocorasick_rs.AhoCorasick(literals), owners, frozenset(always)
+
+    def _build_specialized_matcher(self, literal_patterns: Dict[int, List[tuple]]):
+        """Generate a function that tests every pattern inline, in priority order
+
+        Returns matcher(line, low, single_line) -> index of the first matching
+        pattern, or None. Literal-only patterns become substring checks and
+        the rest are guarded by their required literals before the regex runs.
+        Branches stay in priority order since the first matching pattern wins.
+        """
+        namespace = {}
+        single, multi = [], []
+        for index, (p, compiled, lowered) in enumerate(self.compiled_patterns):
+            namespace[f"_search{index}"] = compiled.search
+            regex_test = f"_search{index}({'low' if lowered else 'line'})"
+            literals = [_required_literal(alt) for alt in _split_alternatives(p.pattern)]
+            if None not in literals:
+                guard = " or ".join(f"{literal!r} in low" for literal in dict.fromkeys(literals))
+                regex_test = f"({guard}) and {regex_test}"
+            multi.append(f"    if {regex_test}: return {index}")
+
+            chains = literal_patterns.get(index)
+            if chains is not None:
+                regex_test = " or ".join(f"({_chain_source(chain)})" for chain in chains)
+            single.append(f"        if {regex_test}: return {index}")
+
+        source = "\n".join([
+            "def matcher(line, low, single_line):",
+            "    if single_line:",
+            *single,
+            "        return None",
+            *multi,
+            "    return None",
+        ])
+        exec(compile(source, "<log-watcher matcher>", "exec"), namespace)
+        return namespace["matcher"]
+
+    def _match_pattern(self, line: str) -> Optional[LogPattern]:
+        """Return the first pattern, in priority order, that matches the line"""
+        if self.native_matcher is not None:
+            # Without multi-line mode, $ only matches at the very end
+            index = self.native_matcher.first_match(line[:-1] if line.endswith("\n") else line)
+            return None if index is None else self.patterns[index]
+
+        candidates = None
+        low = line.lower()
+        if self.prefilter is not None:
+            automaton, owners, always = self.prefilter
+            candidates = set(always)
+            for literal_index, _, _ in automaton.find_matches_as_indexes(low, overlapping=True):
+                candidates.add(owners[literal_index])
+            if not candidates:
+                return None
+
+        # Confirming the few candidates beats running the whole RE2 set
+        if candidates is not None:
+            return self._confirm_candidates(candidates, line, low)
+
+        if self.re2_set is not None:
+            # re's $ also matches before a trailing newline; RE2's does not
+            ids = self.re2_set.Match(line[:-1] if line.endswith("\n") else line)
+            return self.patterns[min(ids)] if ids else None
+
+        index = self.specialized_matcher(line, low, "\n" not in line.rstrip("\n"))
+        return None if index is None else self.patterns[index]
+
+    def _confirm_candidates(self, candidates: Set[int], line: str, low: str) -> Optional[LogPattern]:
+        """Check each candidate pattern in priority order"""
+        # '.*' can't span lines, so literal chains only apply to single lines
+        single_line = "\n" not in line.rstrip("\n")
+        for index in sorted(candidates):
+            pattern, compiled, lowered = self.compiled_patterns[index]
+            chains = self.literal_patterns.get(index) if single_line else None
+            if chains is not None:
+                if any(_chain_in(chain, low) for chain in chains):
+                    return pattern
+            elif compiled.search(low if lowered else line):
+                return pattern
+        return None
 
     def analyze_line(self, line: str, source: str) -> Optional[Dict]:
         """Analyze a log line for known patterns"""
         # Skip if we've seen this exact line recently
-        line_hash = hash(line)
+        line_hash = _line_hash(line)
         if line_hash in self.seen_lines:
+            self.seen_lines.move_to_end(line_hash)
             return None
 
         # Keep seen_lines bounded
-        if len(self.seen_lines) > 10000:
-            self.seen_lines.clear()
-        self.seen_lines.add(line_hash)
-
-        for pattern, compiled in self.compiled_patterns:
-            if compiled.search(line):
-                return {
-                    "log": line.strip(),
-                    "source": source,
-                    "severity": pattern.severity,
-                    "category": pattern.category,
-                    "summary": f"{pattern.name.replace('_', ' ').title()} detected",
-                    "suggested_fix": pattern.suggested_fix,
-                    "timestamp": datetime.now().isoformat(),
-                    "pattern_name": pattern.name,
-                }
+        self.seen_lines[line_hash] = None
+        if len(self.seen_lines) > SEEN_LINES_MAX:
+            self.seen_lines.popitem(last=False)
+
+        pattern = self._match_pattern(line)
+        if pattern:
+            return {
+                "log": line.strip(),
+                "source": source,
+                "severity": pattern.severity,
+                "category": pattern.category,
+                "summary": f"{pattern.name.replace('_', ' ').title()} detected",
+                "suggested_fix": pattern.suggested_fix,
+                "timestamp_ns": time.time_ns(),
+                "pattern_name": pattern.name,
+            }
 
         return None
 
+    async def _read_chunks(self, path: Path, position: int, size: int):
+        """Yield the bytes between position and size in chunks without blocking the loop"""
+        remaining = size - position
+        if AIOFILE_AVAILABLE:
+            async with aiofile.async_open(path, 'rb') as afp:
+                afp.seek(position)
+                while remaining > 0:
+                    chunk = await afp.read(min(READ_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    yield chunk
+        else:
+            with open(path, 'rb') as f:
+                f.seek(position)
+                while remaining > 0:
+                    chunk = await asyncio.to_thread(f.read, min(READ_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    yield chunk
+
+    def _scan_bytes(self, data: bytes, source: str) -> List[Dict]:
+        """Analyze the lines in a block of log data
+
+        With RE2 the block is searched as bytes, and only lines containing a
+        match are decoded and analyzed:
+
+        >>> watcher = LogWatcher([LogPattern("fatal", "^FATAL", "critical", "app")])
+        >>> data = b"FATAL one\\ninfo\\nFATAL two\\nFATAL three\\n"
+        >>> [incident["log"] for incident in watcher._scan_bytes(data, "test")]
+        ['FATAL one', 'FATAL two', 'FATAL three']
+        """
+        incidents = []
+
+        if self.re2_bytes is None:
+            lines = (line.decode('utf-8', errors='ignore') for line in data.splitlines(True))
+        else:
+            lines = []
+            pos = 0
+            while pos < len(data):
+                match = self.re2_bytes.search(data, pos)
+                if match is None:
+                    break
+                start = data.rfind(b"\n", pos, match.start()) + 1 or pos
+                end = data.find(b"\n", match.end())
+                end = len(data) if end == -1 else end + 1
+                lines.append(data[start:end].decode('utf-8', errors='ignore'))
+                pos = end
+
+        for line in lines:
+            incident = self.analyze_line(line, source)
+            if incident:
+                incidents.append(incident)
+        return incidents
+
+    async def _scan_file(self, path: Path, position: int, size: int, source: str):
+        """Analyze the lines appended to a file since `position`
+
+        Returns (incidents, new_position).
+        """
+        incidents = []
+        carry = b""
+        async for chunk in self._read_chunks(path, position, size):
+            position += len(chunk)
+            # Only hand complete lines to the scanner; keep the tail for later
+            data = carry + chunk
+            cut = data.rfind(b"\n") + 1
+            carry = data[cut:]
+            if cut:
+                incidents.extend(self._scan_bytes(data[:cut], source))
+        if carry:
+            incidents.extend(self._scan_bytes(carry, source))
+        return incidents, position
+
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared keep-alive HTTP session, creating it if needed"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
+
+    def _ensure_flusher(self):
+        """Start the background sender if it isn't running"""
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def queue_incident(self, incident: Dict):
+        """Queue an incident for the background sender, waiting while the queue is full"""
+        self._ensure_flusher()
+        await self._queue.put(incident)
+
+    def queue_incident_nowait(self, incident: Dict):
+        """Queue an incident without waiting, dropping the oldest if full
+
+        Only for sources that can't be paused, such as Event Log subscriptions.
+        """
+        self._ensure_flusher()
+        if self._queue.full():
+            dropped = self._queue.get_nowait()
+            self._queue.task_done()
+            print(f"[-] Incident queue full, dropping: {dropped['summary']}")
+        self._queue.put_nowait(incident)
+
+    async def _flush_loop(self):
+        """Collect queued incidents into batches and send them"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + INCIDENT_BATCH_WINDOW
+            while len(batch) < INCIDENT_BATCH_SIZE and loop.time() < deadline:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    await asyncio.sleep(0.01)
+
+            try:
+                await self._send_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _send_batch(self, batch: List[Dict]):
+        """Send a batch of incidents concurrently over the shared session"""
+        await asyncio.gather(*(self.send_incident(incident) for incident in batch))
+
+    async def aclose(self, timeout: float = 10):
+        """Flush queued incidents, then close the shared HTTP session"""
+        if self._flusher is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                print(f"[-] Gave up on {self._queue.qsize()} queued incidents")
+            self._flusher.cancel()
+            self._flusher = None
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _format_timestamp(self, ns: int) -> str:
+        """Format an epoch time in ns like datetime.isoformat(), caching per second"""
+        second, rest = divmod(ns, 1_000_000_000)
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_prefix = datetime.fromtimestamp(second).isoformat()
+        micros = rest // 1000
+        return f"{self._ts_prefix}.{micros:06d}" if micros else self._ts_prefix
+
     async def send_incident(self, incident: Dict) -> bool:
         """Send incident to Kestra or MCP server"""
+        if "timestamp_ns" in incident:
+            incident = dict(incident)
+            incident["timestamp"] = self._format_timestamp(incident.pop("timestamp_ns"))
+        payload = _json_dumps(incident)
+
         headers = {"Content-Type": "application/json"}
         if API_KEY:
             headers["x-api-key"] = API_KEY
@@ -279,20 +989,19 @@ class LogWatcher:
         # Try Kestra first
         try:
             if AIOHTTP_AVAILABLE:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        KESTRA_WEBHOOK_URL,
-                        json=incident,
-                        headers=headers,
-                        timeout=aiohttp.ClientTimeout(total=10)
-                    ) as response:
-                        if response.status == 200:
-                            print(f"[+] Incident sent to Kestra: {incident['summary']}")
-                            return True
+                session = await self._get_session()
+                async with session.post(
+                    KESTRA_WEBHOOK_URL,
+                    data=payload,
+                    headers=headers
+                ) as response:
+                    if response.status == 200:
+                        print(f"[+] Incident sent to Kestra: {incident['summary']}")
+                        return True
             elif REQUESTS_AVAILABLE:
                 response = requests.post(
                     KESTRA_WEBHOOK_URL,
-                    json=incident,
+                    data=payload,
                     headers=headers,
                     timeout=10
                 )
@@ -315,20 +1024,19 @@ class LogWatcher:
             }
 
             if AIOHTTP_AVAILABLE:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        f"{MCP_SERVER_URL}/incidents",
-                        json=mcp_incident,
-                        headers=headers,
-                        timeout=aiohttp.ClientTimeout(total=10)
-                    ) as response:
-                        if response.status == 201:
-                            print(f"[+] Incident sent to MCP server: {incident['summary']}")
-                            return True
+                session = await self._get_session()
+                async with session.post(
+                    f"{MCP_SERVER_URL}/incidents",
+                    data=_json_dumps(mcp_incident),
+                    headers=headers
+                ) as response:
+                    if response.status == 201:
+                        print(f"[+] Incident sent to MCP server: {incident['summary']}")
+                        return True
             elif REQUESTS_AVAILABLE:
                 response = requests.post(
                     f"{MCP_SERVER_URL}/incidents",
-                    json=mcp_incident,
+                    data=_json_dumps(mcp_incident),
                     headers=headers,
                     timeout=10
                 )
@@ -370,13 +1078,11 @@ class FileLogWatcher(LogWatcher):
                     self.position = 0
 
                 if current_size > self.position:
-                    with open(self.file_path, 'r', errors='ignore') as f:
-                        f.seek(self.position)
-                        for line in f:
-                            incident = self.analyze_line(line, str(self.file_path))
-                            if incident:
-                                await self.send_incident(incident)
-                        self.position = f.tell()
+                    incidents, self.position = await self._scan_file(
+                        self.file_path, self.position, current_size, str(self.file_path)
+                    )
+                    for incident in incidents:
+                        await self.queue_incident(incident)
 
                 await asyncio.sleep(MONITOR_INTERVAL)
 
@@ -393,46 +1099,97 @@ class DirectoryLogWatcher(LogWatcher):
         self.directory = Path(directory)
         self.pattern = pattern
         self.file_positions: Dict[str, int] = {}
+        # Bound how many files are scanned at once
+        self._sem = asyncio.Semaphore(DIRECTORY_CONCURRENCY)
 
     async def watch(self):
         """Watch all matching files in directory"""
         print(f"[*] Watching directory: {self.directory} (pattern: {self.pattern})")
 
-        while True:
+        if WATCHDOG_AVAILABLE:
             try:
-                for file_path in self.directory.glob(self.pattern):
-                    await self._process_file(file_path)
+                await self._watch_events()
+                return
+            except OSError as e:
+                # e.g. inotify watch limit reached
+                print(f"[-] File notifications unavailable ({e}), polling instead")
 
+        while True:
+            try:
+                await self._process_files(self.directory.glob(self.pattern))
                 await asyncio.sleep(MONITOR_INTERVAL)
 
             except Exception as e:
                 print(f"[-] Error watching directory: {e}")
                 await asyncio.sleep(MONITOR_INTERVAL)
 
+    async def _watch_events(self):
+        """Process files as the OS reports changes to them"""
+        loop = asyncio.get_running_loop()
+        changed: asyncio.Queue = asyncio.Queue()
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory or event.event_type not in ("created", "modified", "moved"):
+                    return
+                path = getattr(event, "dest_path", "") or event.src_path
+                loop.call_soon_threadsafe(changed.put_nowait, path)
+
+        # Record the current size of existing files before listening
+        await self._process_files(self.directory.glob(self.pattern))
+
+        recursive = "/" in self.pattern or os.sep in self.pattern
+        observer = Observer()
+        observer.schedule(Handler(), str(self.directory), recursive=recursive)
+        observer.start()
+        try:
+            while True:
+                paths = {await changed.get()}
+                await asyncio.sleep(WATCH_DEBOUNCE)
+                while not changed.empty():
+                    paths.add(changed.get_nowait())
+
+                await self._process_files(
+                    Path(p) for p in paths
+                    if Path(p).match(self.pattern) and os.path.isfile(p)
+                )
+        finally:
+            observer.stop()
+            await asyncio.to_thread(observer.join)
+
+    async def _process_files(self, paths):
+        """Process several files concurrently, logging per-file errors"""
+        results = await asyncio.gather(
+            *[self._process_file(p) for p in paths],
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"[-] Error processing file: {result}")
+
     async def _process_file(self, file_path: Path):
         """Process a single file"""
-        str_path = str(file_path)
+        async with self._sem:
+            str_path = str(file_path)
 
-        if str_path not in self.file_positions:
-            # Start from end of file for new files
-            self.file_positions[str_path] = file_path.stat().st_size
-            return
+            if str_path not in self.file_positions:
+                # Start from end of file for new files
+                self.file_positions[str_path] = file_path.stat().st_size
+                return
 
-        current_size = file_path.stat().st_size
-        position = self.file_positions[str_path]
+            current_size = file_path.stat().st_size
+            position = self.file_positions[str_path]
 
-        # File was truncated
-        if current_size < position:
-            position = 0
+            # File was truncated
+            if current_size < position:
+                position = 0
 
-        if current_size > position:
-            with open(file_path, 'r', errors='ignore') as f:
-                f.seek(position)
-                for line in f:
-                    incident = self.analyze_line(line, str_path)
-                    if incident:
-                        await self.send_incident(incident)
-                self.file_positions[str_path] = f.tell()
+            if current_size > position:
+                incidents, self.file_positions[str_path] = await self._scan_file(
+                    file_path, position, current_size, str_path
+                )
+                for incident in incidents:
+                    await self.queue_incident(incident)
 
 
 class DockerLogWatcher(LogWatcher):
@@ -441,19 +1198,33 @@ class DockerLogWatcher(LogWatcher):
     def __init__(self, containers: List[str], **kwargs):
         super().__init__(**kwargs)
         self.containers = containers
-        if not DOCKER_AVAILABLE:
-            raise ImportError("docker package required: pip install docker")
-        self.client = docker.from_env()
+        if AIODOCKER_AVAILABLE:
+            # The aiodocker client needs a running event loop; created in watch()
+            self.client = None
+        elif DOCKER_AVAILABLE:
+            self.client = docker.from_env()
+        else:
+            raise ImportError("docker package required: pip install aiodocker (or docker)")
 
     async def watch(self):
         """Watch all specified containers"""
         print(f"[*] Watching Docker containers: {', '.join(self.containers)}")
 
-        tasks = [self._watch_container(name) for name in self.containers]
-        await asyncio.gather(*tasks)
+        if AIODOCKER_AVAILABLE:
+            self.client = aiodocker.Docker()
+        try:
+            tasks = [self._watch_container(name) for name in self.containers]
+            await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            if AIODOCKER_AVAILABLE:
+                await self.client.close()
 
     async def _watch_container(self, container_name: str):
         """Watch a single container"""
+        if AIODOCKER_AVAILABLE:
+            await self._stream_container(container_name)
+            return
+
         try:
             container = self.client.containers.get(container_name)
 
@@ -462,6 +1233,7 @@ class DockerLogWatcher(LogWatcher):
                 line = log.decode('utf-8', errors='ignore')
                 incident = self.analyze_line(line, f"docker:{container_name}")
                 if incident:
+                    # The blocking log stream never yields to the flusher, so send inline
                     await self.send_incident(incident)
 
         except docker.errors.NotFound:
@@ -469,6 +1241,28 @@ class DockerLogWatcher(LogWatcher):
         except Exception as e:
             print(f"[-] Error watching container {container_name}: {e}")
 
+    async def _stream_container(self, container_name: str):
+        """Watch a single container through the async Docker API"""
+        try:
+            container = await self.client.containers.get(container_name)
+
+            # Frames arrive demultiplexed from stdout/stderr, starting at the current time
+            async for chunk in container.log(
+                stdout=True, stderr=True, follow=True, since=int(time.time())
+            ):
+                for line in chunk.splitlines():
+                    incident = self.analyze_line(line, f"docker:{container_name}")
+                    if incident:
+                        await self.queue_incident(incident)
+
+        except aiodocker.exceptions.DockerError as e:
+            if e.status == 404:
+                print(f"[-] Container not found: {container_name}")
+            else:
+                print(f"[-] Error watching container {container_name}: {e}")
+        except Exception as e:
+            print(f"[-] Error watching container {container_name}: {e}")
+
 
 class WindowsEventLogWatcher(LogWatcher):
     """Watch Windows Event Log"""
@@ -483,12 +1277,90 @@ class WindowsEventLogWatcher(LogWatcher):
         """Watch Windows Event Logs"""
         print(f"[*] Watching Windows Event Logs: {', '.join(self.log_names)}")
 
-        # Use PowerShell to get events
+        if WIN32EVTLOG_AVAILABLE:
+            await self._watch_subscriptions()
+        else:
+            await self._poll_logs(self.log_names)
+
+    async def _poll_logs(self, log_names: List[str]):
+        """Poll event logs through PowerShell"""
         while True:
-            for log_name in self.log_names:
+            for log_name in log_names:
                 await self._check_log(log_name)
             await asyncio.sleep(MONITOR_INTERVAL)
 
+    async def _watch_subscriptions(self):
+        """Receive events from the native Event Log API as they are written"""
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue = asyncio.Queue()
+        render_context = win32evtlog.EvtCreateRenderContext(win32evtlog.EvtRenderContextSystem)
+        # Publisher metadata by provider; None once opening it has failed
+        publishers = {}
+        unformatted: Set[str] = set()
+
+        # Called by Windows on a thread pool thread
+        def on_event(action, log_name, event):
+            if action != win32evtlog.EvtSubscribeActionDeliver:
+                return
+            provider = None
+            message = None
+            try:
+                values = win32evtlog.EvtRender(
+                    event, win32evtlog.EvtRenderEventValues, Context=render_context
+                )
+                provider = values[win32evtlog.EvtSystemProviderName][0]
+                if provider not in publishers:
+                    publishers[provider] = None
+                    publishers[provider] = win32evtlog.EvtOpenPublisherMetadata(provider)
+                if publishers[provider] is not None:
+                    message = win32evtlog.EvtFormatMessage(
+                        publishers[provider], event, win32evtlog.EvtFormatMessageEvent
+                    )
+            except Exception as e:
+                key = provider or log_name
+                if key not in unformatted:
+                    unformatted.add(key)
+                    print(f"[-] Cannot format events from {key}, using event data: {e}")
+
+            if message is None:
+                # Publisher has no metadata or message resources
+                try:
+                    message = _event_data_text(
+                        win32evtlog.EvtRender(event, win32evtlog.EvtRenderEventXml)
+                    )
+                except Exception:
+                    return
+            loop.call_soon_threadsafe(events.put_nowait, (log_name, message))
+
+        # Subscriptions stay active for as long as their handles are referenced
+        subscriptions = []
+        failed = []
+        for log_name in self.log_names:
+            try:
+                subscriptions.append(win32evtlog.EvtSubscribe(
+                    log_name,
+                    win32evtlog.EvtSubscribeToFutureEvents,
+                    Callback=on_event,
+                    Context=log_name,
+                    Query=WINDOWS_EVENT_QUERY,
+                ))
+            except Exception as e:
+                print(f"[-] Cannot subscribe to {log_name}, polling it instead: {e}")
+                failed.append(log_name)
+
+        # Logs that can't be subscribed to are polled through PowerShell
+        poller = asyncio.create_task(self._poll_logs(failed)) if failed else None
+        try:
+            while True:
+                log_name, message = await events.get()
+                incident = self.analyze_line(message, f"windows:{log_name}")
+                if incident:
+                    self.queue_incident_nowait(incident)
+        finally:
+            if poller is not None:
+                poller.cancel()
+            subscriptions.clear()
+
     async def _check_log(self, log_name: str):
         """Check a specific Windows event log"""
         try:
@@ -502,7 +1374,7 @@ class WindowsEventLogWatcher(LogWatcher):
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
 
             if result.returncode == 0 and result.stdout:
-                events = json.loads(result.stdout)
+                events = _json_loads(result.stdout)
                 if not isinstance(events, list):
                     events = [events]
 
@@ -510,7 +1382,7 @@ class WindowsEventLogWatcher(LogWatcher):
                     message = event.get("Message", "")
                     incident = self.analyze_line(message, f"windows:{log_name}")
                     if incident:
-                        await self.send_incident(incident)
+                        await self.queue_incident(incident)
 
         except Exception as e:
             print(f"[-] Error checking Windows Event Log {log_name}: {e}")
@@ -528,6 +1400,10 @@ class SystemdJournalWatcher(LogWatcher):
         unit_str = " ".join([f"-u {u}" for u in self.units]) if self.units else ""
         print(f"[*] Watching systemd journal {unit_str or '(all units)'}")
 
+        if SYSTEMD_AVAILABLE:
+            await self._watch_reader()
+            return
+
         cmd = ["journalctl", "-f", "-n", "0", "-o", "json"]
         if self.units:
             for unit in self.units:
@@ -542,19 +1418,47 @@ class SystemdJournalWatcher(LogWatcher):
 
             async for line in process.stdout:
                 try:
-                    entry = json.loads(line.decode('utf-8', errors='ignore'))
+                    entry = _json_loads(line)
                     message = entry.get("MESSAGE", "")
                     unit = entry.get("_SYSTEMD_UNIT", "unknown")
 
                     incident = self.analyze_line(message, f"systemd:{unit}")
                     if incident:
-                        await self.send_incident(incident)
+                        await self.queue_incident(incident)
                 except json.JSONDecodeError:
                     pass
 
         except Exception as e:
             print(f"[-] Error watching systemd journal: {e}")
 
+    async def _watch_reader(self):
+        """Read entries directly from the journal files"""
+        reader = journal.Reader()
+        reader.this_boot()
+        # Matches on the same field are ORed together
+        for unit in self.units:
+            reader.add_match(_SYSTEMD_UNIT=unit)
+        reader.seek_tail()
+        reader.get_previous()
+
+        def next_entries():
+            reader.wait(MONITOR_INTERVAL)
+            return list(reader)
+
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                for entry in await loop.run_in_executor(None, next_entries):
+                    message = entry.get("MESSAGE", "")
+                    unit = entry.get("_SYSTEMD_UNIT", "unknown")
+
+                    incident = self.analyze_line(str(message), f"systemd:{unit}")
+                    if incident:
+                        await self.queue_incident(incident)
+
+        except Exception as e:
+            print(f"[-] Error watching systemd journal: {e}")
+
 
 async def main():
     # Declare global variables before using them
@@ -650,9 +1554,15 @@ async def main():
     if watcher:
         try:
             await watcher.watch()
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
             print("\n[*] Shutting down...")
+        finally:
+            await watcher.aclose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if UVLOOP_AVAILABLE:
+        # libuv-based event loop with cheaper task scheduling and socket I/O
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -0,0 +1,42 @@
+//! Native multi-pattern matcher for the log watcher.
+//!
+//! All patterns are compiled into one `regex::RegexSet`, so a line is
+//! checked against every pattern in a single pass, with the GIL released.
+
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use regex::{RegexSet, RegexSetBuilder};
+
+/// Case-insensitive matcher over a fixed, ordered list of patterns.
+#[pyclass(frozen)]
+struct Matcher {
+    set: RegexSet,
+}
+
+#[pymethods]
+impl Matcher {
+    #[new]
+    fn new(patterns: Vec<String>) -> PyResult<Self> {
+        let set = RegexSetBuilder::new(&patterns)
+            .case_insensitive(true)
+            .build()
+            .map_err(|e| PyValueError::new_err(e.to_string()))?;
+        Ok(Matcher { set })
+    }
+
+    /// Index of the first pattern, in list order, that matches the line.
+    fn first_match(&self, py: Python<'_>, line: &str) -> Option<usize> {
+        py.allow_threads(|| self.set.matches(line).iter().next())
+    }
+
+    /// Number of patterns in the set.
+    fn __len__(&self) -> usize {
+        self.set.len()
+    }
+}
+
+#[pymodule]
+fn logwatcher_rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_class::<Matcher>()?;
+    Ok(())
+}